@@ -1,12 +1,17 @@
 """
 Factory methods that create (not necessarily realistic) nodes
 that validate against their schemas.
+
+Set the ROMAN_FACTORY_REUSE_ARRAYS environment variable to 1 to have
+the large array attributes (e.g. WfiImage.data) generated once per
+field and copied into the arrays of later nodes.  Different fields
+never share values, and every node gets its own writable copy.
 """
 from datetime import datetime
+import functools
 import math
-import random
+import os
 import re
-import secrets
 import sys
 
 from astropy.time import Time
@@ -36,17 +41,180 @@ __all__ = [
     "create_visit",
     "create_wcsinfo",
     "create_wfi_image",
+    "create_wfi_images",
     "create_wfi_mode",
     "create_wfi_science_raw",
+    "reseed",
+    "set_raw_mode",
 ]
 
 
+def _create_rng(seed=None, stream=0):
+    # SFC64 is one of the fastest bit generators numpy offers, which
+    # matters for the 4096x4096 arrays.  Spawning from a SeedSequence
+    # gives each stream index an independent state, so parallel test
+    # workers sharing a seed won't collide.
+    seed_sequence = np.random.SeedSequence(seed).spawn(stream + 1)[stream]
+    return np.random.Generator(np.random.SFC64(seed_sequence))
+
+
+# Source of all random values in this module.  Set ROMAN_FACTORY_SEED
+# (or call reseed) to make the factories reproducible.
+_RNG = _create_rng(
+    None if os.environ.get("ROMAN_FACTORY_SEED") is None
+    else int(os.environ["ROMAN_FACTORY_SEED"])
+)
+
+
+_BOOLS = (True, False)
+
+_CAL_STEP_STATUSES = ("N/A", "COMPLETE", "SKIPPED", "INCOMPLETE")
+
+_DETECTORS = tuple(f"WFI{i:02d}" for i in range(1, 19))
+
+_ENGINEERING_QUALITIES = ("OK", "SUSPECT")
+
+_EPHEMERIS_TYPES = ("DEFINITIVE", "PREDICTED")
+
+_EXPOSURE_TYPES = (
+    "WFI_DARK",
+    "WFI_FLAT",
+    "WFI_GRISM",
+    "WFI_IMAGE",
+    "WFI_PRISM",
+    "WFI_WFSC",
+)
+
+# TODO: Replace ENGINEERING with F213 once
+# https://github.com/spacetelescope/rad/issues/6 is resolved.
+_OPTICAL_ELEMENTS = (
+    "F062",
+    "F087",
+    "F106",
+    "F129",
+    "W146",
+    "F158",
+    "F184",
+    "GRISM",
+    "PRISM",
+    "DARK",
+    "ENGINEERING",
+)
+
+_POINTING_ENGDB_QUALITIES = ("CALCULATED", "PLANNED")
+
+_SOURCE_TYPES = ("EXTENDED", "POINT", "UNKNOWN")
+
+_TARGET_TYPES = ("FIXED", "MOVING", "GENERIC")
+
+
+# When True, factories return the raw dict instead of wrapping
+# it in a node object.
+_raw_only = False
+
+
+def set_raw_mode(value):
+    """
+    Make the factory methods return plain dicts instead of
+    stnode instances.
+
+    Parameters
+    ----------
+    value : bool
+        True to return plain dicts, False (the default) to return
+        node instances.
+    """
+    global _raw_only
+    _raw_only = bool(value)
+
+
+def reseed(seed=None, stream=0):
+    """
+    Reset the random state used by the factory methods, so that
+    subsequent calls produce reproducible values.
+
+    Parameters
+    ----------
+    seed : int, optional
+        Seed for the random number generator.  If None, fresh
+        entropy is pulled from the OS.
+    stream : int, optional
+        Index of an independent stream for the given seed, e.g. a
+        parallel test worker's number.
+    """
+    global _RNG, _times
+    _RNG = _create_rng(seed, stream)
+    _float_buffer.clear()
+    _int_buffer.clear()
+    _times = iter(())
+    _SCRATCH.clear()
+
+
+def _node(node_class, raw):
+    return raw if _raw_only else node_class(raw)
+
+
+# Filled arrays from helpers decorated with _maybe_reuse, keyed on
+# field, helper name and arguments.
+_SCRATCH = {}
+
+
+def _reuse_arrays_enabled():
+    return os.environ.get("ROMAN_FACTORY_REUSE_ARRAYS") == "1"
+
+
+def _maybe_reuse(array_helper):
+    """
+    Fill the first array built by ``array_helper`` for a given node
+    field and set of arguments once, and hand out copies of it on later
+    calls, when the ROMAN_FACTORY_REUSE_ARRAYS environment variable is
+    set to 1.  Copying is several times faster than generating the
+    random values again.  Only calls that pass ``field`` (e.g.
+    "WfiImage.data") are eligible, so distinct fields never share values.
+    """
+    @functools.wraps(array_helper)
+    def wrapper(*args, field=None, **kwargs):
+        if field is None or not kwargs.get("fill", True) or not _reuse_arrays_enabled():
+            return array_helper(*args, **kwargs)
+        key = (field, array_helper.__name__, args, tuple(sorted(kwargs.items())))
+        if key not in _SCRATCH:
+            _SCRATCH[key] = array_helper(*args, **kwargs)
+        scratch = _SCRATCH[key]
+        array = np.empty_like(scratch)
+        np.copyto(array, scratch)
+        return array
+
+    return wrapper
+
+
+# Scalar values are drawn from _RNG in batches of this size and
+# popped off one at a time, since a Generator call per value would
+# be dominated by call overhead.
+_SCALAR_BATCH_SIZE = 4096
+_float_buffer = []
+_int_buffer = []
+
+
+def _next_float():
+    # Uniform float in [0, 1)
+    if not _float_buffer:
+        _float_buffer.extend(_RNG.random(_SCALAR_BATCH_SIZE).tolist())
+    return _float_buffer.pop()
+
+
+def _next_int():
+    # Uniform int in [0, 2**63)
+    if not _int_buffer:
+        _int_buffer.extend(_RNG.integers(2 ** 63, size=_SCALAR_BATCH_SIZE).tolist())
+    return _int_buffer.pop()
+
+
 def _random_float(min=None, max=None):
     if min is None:
         min = sys.float_info.max * -1.0
     if max is None:
         max = sys.float_info.max
-    value = random.random()
+    value = _next_float()
     return min + max * value - min * value
 
 
@@ -73,7 +241,7 @@ def _random_utc_timestamp():
 
 
 def _random_string_timestamp():
-    return datetime.utcfromtimestamp(_random_utc_timestamp()).strftime("%Y-%m-%dT%H:%M:%S.%f")[0:23]
+    return datetime.utcfromtimestamp(_random_utc_timestamp()).isoformat(timespec="milliseconds")
 
 
 def _random_string_date():
@@ -81,11 +249,22 @@ def _random_string_date():
 
 
 def _random_string_time():
-    return datetime.utcfromtimestamp(_random_utc_timestamp()).strftime("%H:%M:%S.%f")[0:12]
+    return datetime.utcfromtimestamp(_random_utc_timestamp()).time().isoformat(timespec="milliseconds")
+
+
+# Constructing a Time is slow compared to indexing into an existing
+# one, so they're built in batches and handed out one at a time.
+_TIME_BATCH_SIZE = 256
+_times = iter(())
 
 
 def _random_astropy_time():
-    return Time(_random_utc_timestamp(), format="unix")
+    global _times
+    try:
+        return next(_times)
+    except StopIteration:
+        _times = iter(Time(_random_utc_timestamps(_TIME_BATCH_SIZE), format="unix"))
+        return next(_times)
 
 
 def _random_int(min=None, max=None):
@@ -94,105 +273,144 @@ def _random_int(min=None, max=None):
         min = -1 * 2 ** 31
     if max is None:
         max = 2 ** 31 - 1
-    return random.randint(min, max)
+    # The modulo bias is negligible for ranges this much smaller than 2**63
+    return min + _next_int() % (max - min + 1)
 
 
 def _random_positive_int(max=None):
     return _random_int(0, max)
 
 
-def _random_choice(*args):
-    return random.choice(args)
+def _random_floats(count, min=None, max=None):
+    # Like _random_float, for count values.  Drawing from the scalar
+    # buffer beats a Generator call of its own for the small counts
+    # the factories need.
+    return [_random_float(min, max) for _ in range(count)]
 
 
-def _random_string(prefix="", max_length=None):
+def _random_positive_floats(count, max=None):
+    return _random_floats(count, min=0.0, max=max)
+
+
+def _random_mjd_timestamps(count):
+    # Random timestamps between 2020-01-01 and 2030-01-01
+    return _random_floats(count, 58849.0, 62502.0)
+
+
+def _random_utc_timestamps(count):
+    # Random timestamps between 2020-01-01 and 2030-01-01
+    return _random_floats(count, 1577836800.0, 1893456000.0)
+
+
+def _random_ints(count, min=None, max=None):
+    # Like _random_int, for count values
+    return [_random_int(min, max) for _ in range(count)]
+
+
+def _random_positive_ints(count, max=None):
+    return _random_ints(count, 0, max)
+
+
+def _random_string_length(prefix, max_length):
+    # Number of random bytes to hex-encode after prefix
     if max_length is not None:
-        random_length = min(16, max_length - len(prefix))
+        return min(16, max_length - len(prefix))
     else:
-        random_length = 16
+        return 16
+
+
+def _random_string(prefix="", max_length=None):
+    return prefix + _RNG.bytes(_random_string_length(prefix, max_length)).hex()
+
+
+def _random_strings(specs):
+    # Like _random_string for each (prefix, max_length) in specs, but
+    # draws the random bytes for all of them in a single call
+    lengths = [_random_string_length(prefix, max_length) for prefix, max_length in specs]
+    hex_digits = _RNG.bytes(sum(lengths)).hex()
+
+    strings = []
+    offset = 0
+    for (prefix, _), length in zip(specs, lengths):
+        strings.append(prefix + hex_digits[offset:offset + 2 * length])
+        offset += 2 * length
 
-    return prefix + secrets.token_hex(random_length)
+    return strings
 
 
-def _random_bool():
-    return _random_choice(*[True, False])
+def _random_choice(options):
+    return options[_random_int(0, len(options) - 1)]
 
 
-def _random_array_float32(size=(4096, 4096), min=None, max=None):
+_random_bool = functools.partial(_random_choice, _BOOLS)
+
+
+def _random_bits(size, dtype):
+    # Unsigned integer array covering the full range of dtype, filled
+    # 64 bits at a time directly from the bit generator.  About twice
+    # as fast as Generator.integers for the 4096x4096 arrays.
+    dtype = np.dtype(dtype)
+    count = int(np.prod(size))
+    words = -(-count * dtype.itemsize // 8)
+    return _RNG.bit_generator.random_raw(words).view(dtype)[:count].reshape(size)
+
+
+@_maybe_reuse
+def _random_array_float32(size=(4096, 4096), min=None, max=None, fill=True):
+    if not fill:
+        return np.empty(size, dtype=np.float32)
     if min is None:
         min = np.finfo("float32").min
     if max is None:
         max = np.finfo("float32").max
-    array = np.random.default_rng().random(size=size, dtype=np.float32)
-    return min + max * array - min * array
-
-
-def _random_array_uint16(size=(4096, 4096), min=None, max=None):
+    # Build floats in [1, 2) by placing 23 random bits in the mantissa
+    # of 1.0, then shift down to [0, 1).  All in place, to avoid extra
+    # copies of what are usually very large arrays.
+    bits = _random_bits(size, np.uint32)
+    bits >>= 9
+    bits |= 0x3F800000
+    array = bits.view(np.float32)
+    array -= 1.0
+    # Same as min + max * array - min * array, ordered so that the
+    # intermediate values can't overflow float32.
+    result = array * max
+    result += min
+    array *= min
+    result -= array
+    return result
+
+
+@_maybe_reuse
+def _random_array_uint16(size=(4096, 4096), min=None, max=None, fill=True):
+    if not fill:
+        return np.empty(size, dtype=np.uint16)
+    if min is None and max is None:
+        return _random_bits(size, np.uint16)
     if min is None:
         min = np.iinfo("uint16").min
     if max is None:
         max = np.iinfo("uint16").max
-    return np.random.randint(min, high=max, size=size, dtype=np.uint16)
+    return _RNG.integers(min, max, size=size, dtype=np.uint16)
 
 
-def _random_array_uint32(size=(4096, 4096), min=None, max=None):
+@_maybe_reuse
+def _random_array_uint32(size=(4096, 4096), min=None, max=None, fill=True):
+    if not fill:
+        return np.empty(size, dtype=np.uint32)
+    if min is None and max is None:
+        return _random_bits(size, np.uint32)
     if min is None:
         min = np.iinfo("uint32").min
     if max is None:
         max = np.iinfo("uint32").max
-    return np.random.randint(min, high=max, size=size, dtype=np.uint32)
+    return _RNG.integers(min, max, size=size, dtype=np.uint32)
 
 
-def _random_exposure_type():
-    return _random_choice(
-        "WFI_DARK",
-        "WFI_FLAT",
-        "WFI_GRISM",
-        "WFI_IMAGE",
-        "WFI_PRISM",
-        "WFI_WFSC",
-    )
+_random_exposure_type = functools.partial(_random_choice, _EXPOSURE_TYPES)
 
+_random_detector = functools.partial(_random_choice, _DETECTORS)
 
-def _random_detector():
-    return _random_choice(
-        "WFI01",
-        "WFI02",
-        "WFI03",
-        "WFI04",
-        "WFI05",
-        "WFI06",
-        "WFI07",
-        "WFI08",
-        "WFI09",
-        "WFI10",
-        "WFI11",
-        "WFI12",
-        "WFI13",
-        "WFI14",
-        "WFI15",
-        "WFI16",
-        "WFI17",
-        "WFI18",
-    )
-
-
-def _random_optical_element():
-    # TODO: Replace ENGINEERING with F213 once
-    # https://github.com/spacetelescope/rad/issues/6 is resolved.
-    return _random_choice(
-        "F062",
-        "F087",
-        "F106",
-        "F129",
-        "W146",
-        "F158",
-        "F184",
-        "GRISM",
-        "PRISM",
-        "DARK",
-        "ENGINEERING",
-    )
+_random_optical_element = functools.partial(_random_choice, _OPTICAL_ELEMENTS)
 
 
 def _random_software_version():
@@ -225,7 +443,7 @@ def create_aperture(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Aperture(raw)
+    return _node(stnode.Aperture, raw)
 
 
 def create_cal_step(**kwargs):
@@ -243,11 +461,11 @@ def create_cal_step(**kwargs):
     roman_datamodels.stnode.CalStep
     """
     raw = {
-        "flat_field": _random_choice("N/A", "COMPLETE", "SKIPPED", "INCOMPLETE"),
+        "flat_field": _random_choice(_CAL_STEP_STATUSES),
     }
     raw.update(kwargs)
 
-    return stnode.CalStep(raw)
+    return _node(stnode.CalStep, raw)
 
 
 def create_coordinates(**kwargs):
@@ -269,7 +487,7 @@ def create_coordinates(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Coordinates(raw)
+    return _node(stnode.Coordinates, raw)
 
 
 def create_ephemeris(**kwargs):
@@ -291,7 +509,7 @@ def create_ephemeris(**kwargs):
         "ephemeris_reference_frame": _random_string("Frame ", 10),
         "moon_angle": _random_angle_radians(),
         "time": _random_mjd_timestamp(),
-        "type": _random_choice("DEFINITIVE", "PREDICTED"),
+        "type": _random_choice(_EPHEMERIS_TYPES),
         "spatial_x": _random_float(),
         "spatial_y": _random_float(),
         "spatial_z": _random_float(),
@@ -302,7 +520,7 @@ def create_ephemeris(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Ephemeris(raw)
+    return _node(stnode.Ephemeris, raw)
 
 
 def create_exposure(**kwargs):
@@ -319,38 +537,41 @@ def create_exposure(**kwargs):
     -------
     roman_datamodels.stnode.Exposure
     """
+    positive_floats = iter(_random_positive_floats(8))
+    mjd_timestamps = iter(_random_mjd_timestamps(6))
+    positive_ints = iter(_random_positive_ints(8))
     raw = {
-        "datamode": _random_positive_int(),
+        "datamode": next(positive_ints),
         "data_problem": _random_bool(),
-        "duration": _random_positive_float(),
-        "effective_exposure_time": _random_positive_float(),
-        "elapsed_exposure_time": _random_positive_float(),
+        "duration": next(positive_floats),
+        "effective_exposure_time": next(positive_floats),
+        "elapsed_exposure_time": next(positive_floats),
         "end_time": _random_astropy_time(),
-        "end_time_mjd": _random_mjd_timestamp(),
-        "end_time_tdb": _random_mjd_timestamp(),
-        "exposure_time": _random_positive_float(),
-        "frame_divisor": _random_positive_int(),
-        "frame_time": _random_positive_float(),
-        "gain_factor": _random_positive_float(),
-        "group_time": _random_positive_float(),
-        "groupgap": _random_positive_int(),
-        "id": _random_positive_int(),
-        "integration_time": _random_positive_float(),
+        "end_time_mjd": next(mjd_timestamps),
+        "end_time_tdb": next(mjd_timestamps),
+        "exposure_time": next(positive_floats),
+        "frame_divisor": next(positive_ints),
+        "frame_time": next(positive_floats),
+        "gain_factor": next(positive_floats),
+        "group_time": next(positive_floats),
+        "groupgap": next(positive_ints),
+        "id": next(positive_ints),
+        "integration_time": next(positive_floats),
         "mid_time": _random_astropy_time(),
-        "mid_time_mjd": _random_mjd_timestamp(),
-        "mid_time_tdb": _random_mjd_timestamp(),
-        "nframes": _random_positive_int(),
-        "ngroups": _random_positive_int(),
-        "nresets_at_start": _random_positive_int(),
-        "sca_number": _random_positive_int(),
+        "mid_time_mjd": next(mjd_timestamps),
+        "mid_time_tdb": next(mjd_timestamps),
+        "nframes": next(positive_ints),
+        "ngroups": next(positive_ints),
+        "nresets_at_start": next(positive_ints),
+        "sca_number": next(positive_ints),
         "start_time": _random_astropy_time(),
-        "start_time_mjd": _random_mjd_timestamp(),
-        "start_time_tdb": _random_mjd_timestamp(),
+        "start_time_mjd": next(mjd_timestamps),
+        "start_time_tdb": next(mjd_timestamps),
         "type": _random_exposure_type(),
     }
     raw.update(kwargs)
 
-    return stnode.Exposure(raw)
+    return _node(stnode.Exposure, raw)
 
 
 def create_ref_meta(**kwargs):
@@ -399,14 +620,14 @@ def create_flat_ref(**kwargs):
     roman_datamodels.stnode.FlatRef
     """
     raw = {
-        "data": _random_array_float32(min=0.0),
-        "dq": _random_array_uint32(),
-        "err": _random_array_float32(min=0.0),
+        "data": _random_array_float32(min=0.0, field="FlatRef.data"),
+        "dq": _random_array_uint32(field="FlatRef.dq"),
+        "err": _random_array_float32(min=0.0, field="FlatRef.err"),
         "meta": create_ref_meta(reftype="FLAT"),
     }
     raw.update(kwargs)
 
-    return stnode.FlatRef(raw)
+    return _node(stnode.FlatRef, raw)
 
 
 def create_guidestar(**kwargs):
@@ -423,38 +644,47 @@ def create_guidestar(**kwargs):
     -------
     roman_datamodels.stnode.Guidestar
     """
+    floats = iter(_random_floats(4))
+    positive_floats = iter(_random_positive_floats(11))
+    mjd_timestamps = iter(_random_mjd_timestamps(2))
+    strings = iter(_random_strings([
+        ("Epoch ", 10),
+        ("Status ", 15),
+        ("ID ", 20),
+        ("PCS ", 10),
+    ]))
     raw = {
-        "data_end": _random_mjd_timestamp(),
-        "data_start": _random_mjd_timestamp(),
-        "gs_ctd_ux": _random_positive_float(),
-        "gs_ctd_uy": _random_positive_float(),
-        "gs_ctd_x": _random_positive_float(),
-        "gs_ctd_y": _random_positive_float(),
+        "data_end": next(mjd_timestamps),
+        "data_start": next(mjd_timestamps),
+        "gs_ctd_ux": next(positive_floats),
+        "gs_ctd_uy": next(positive_floats),
+        "gs_ctd_x": next(positive_floats),
+        "gs_ctd_y": next(positive_floats),
         "gs_dec": _random_float(math.pi / -2.0, math.pi / 2.0),
-        "gs_epoch": _random_string("Epoch ", 10),
-        "gs_mag": _random_float(),
-        "gs_mudec": _random_float(),
-        "gs_mura": _random_float(),
-        "gs_para": _random_float(),
+        "gs_epoch": next(strings),
+        "gs_mag": next(floats),
+        "gs_mudec": next(floats),
+        "gs_mura": next(floats),
+        "gs_para": next(floats),
         "gs_ra": _random_angle_radians(),
-        "gs_udec": _random_positive_float(),
-        "gs_umag": _random_positive_float(),
-        "gs_ura": _random_positive_float(),
-        "gw_acq_exec_stat": _random_string("Status ", 15),
-        "gw_id": _random_string("ID ", 20),
+        "gs_udec": next(positive_floats),
+        "gs_umag": next(positive_floats),
+        "gs_ura": next(positive_floats),
+        "gw_acq_exec_stat": next(strings),
+        "gw_id": next(strings),
         "gw_function_end_time": _random_astropy_time(),
         "gw_function_start_time": _random_astropy_time(),
-        "gw_pcs_mode": _random_string("PCS ", 10),
+        "gw_pcs_mode": next(strings),
         "gw_start_time": _random_astropy_time(),
         "gw_stop_time": _random_astropy_time(),
-        "gw_window_xsize": _random_positive_float(),
-        "gw_window_xstart": _random_positive_float(),
-        "gw_window_ysize": _random_positive_float(),
-        "gw_window_ystart": _random_positive_float(),
+        "gw_window_xsize": next(positive_floats),
+        "gw_window_xstart": next(positive_floats),
+        "gw_window_ysize": next(positive_floats),
+        "gw_window_ystart": next(positive_floats),
     }
     raw.update(kwargs)
 
-    return stnode.Guidestar(raw)
+    return _node(stnode.Guidestar, raw)
 
 
 def create_meta(**kwargs):
@@ -471,33 +701,11 @@ def create_meta(**kwargs):
     -------
     dict
     """
-    raw = {
-        "aperture": create_aperture(),
-        "cal_step": create_cal_step(),
-        "calibration_software_version": _random_string("Version ", 120),
-        "coordinates": create_coordinates(),
-        "crds_context_used": "roman_{:04d}.pmap".format(_random_positive_int(9999)),
-        "crds_software_version": _random_software_version(),
-        "file_date": _random_astropy_time(),
-        "ephemeris": create_ephemeris(),
-        "exposure": create_exposure(),
-        "filename": _random_string("Filename ", 120),
-        "guidestar": create_guidestar(),
-        "instrument": create_wfi_mode(),
-        "model_type": _random_string("Model type ", 50),
-        "observation": create_observation(),
-        "photometry": create_photometry(),
-        "pointing": create_pointing(),
-        "prd_software_version": _random_string("S&OC PRD ", 120),
-        "origin": "STSCI",
-        "program": create_program(),
-        "sdf_software_version": _random_software_version(),
-        "target": create_target(),
-        "telescope": "ROMAN",
-        "velocity_aberration": create_velocity_aberration(),
-        "visit": create_visit(),
-        "wcsinfo": create_wcsinfo(),
-    }
+    # The random values are built by _META_BUILDERS, defined at the end
+    # of this module.  Only build the ones that kwargs doesn't override.
+    raw = {key: build() for key, build in _META_BUILDERS if key not in kwargs}
+    raw["origin"] = "STSCI"
+    raw["telescope"] = "ROMAN"
     raw.update(kwargs)
 
     return raw
@@ -517,28 +725,36 @@ def create_observation(**kwargs):
     -------
     roman_datamodels.stnode.Observation
     """
+    strings = iter(_random_strings([
+        ("MA table ", None),
+        ("Obs ID ", 26),
+        ("Observation label ", None),
+        ("Template ", 50),
+        ("", 2),
+        ("Visit ID ", 19),
+    ]))
     raw = {
         "end_time": _random_astropy_time(),
         "execution_plan": _random_positive_int(),
         "exposure": _random_positive_int(),
-        "ma_table_name": _random_string("MA table "),
-        "obs_id": _random_string("Obs ID ", 26),
+        "ma_table_name": next(strings),
+        "obs_id": next(strings),
         "observation": _random_positive_int(),
-        "observation_label": _random_string("Observation label "),
+        "observation_label": next(strings),
         "pass": _random_positive_int(),
         "program": _random_positive_int(),
         "segment": _random_positive_int(),
         "start_time": _random_astropy_time(),
-        "template": _random_string("Template ", 50),
+        "template": next(strings),
         "visit": _random_positive_int(),
-        "visit_file_activity": _random_string(max_length=2),
+        "visit_file_activity": next(strings),
         "visit_file_group": _random_positive_int(),
         "visit_file_sequence": _random_positive_int(),
-        "visit_id": _random_string("Visit ID ", 19),
+        "visit_id": next(strings),
     }
     raw.update(kwargs)
 
-    return stnode.Observation(raw)
+    return _node(stnode.Observation, raw)
 
 
 def create_photometry(**kwargs):
@@ -563,7 +779,7 @@ def create_photometry(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Photometry(raw)
+    return _node(stnode.Photometry, raw)
 
 
 def create_pixelarea(**kwargs):
@@ -581,11 +797,11 @@ def create_pixelarea(**kwargs):
     roman_datamodels.stnode.Pixelarea
     """
     raw = {
-        "area": _random_array_float32(min=0.0),
+        "area": _random_array_float32(min=0.0, field="Pixelarea.area"),
     }
     raw.update(kwargs)
 
-    return stnode.Pixelarea(raw)
+    return _node(stnode.Pixelarea, raw)
 
 
 def create_pointing(**kwargs):
@@ -609,7 +825,7 @@ def create_pointing(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Pointing(raw)
+    return _node(stnode.Pointing, raw)
 
 
 def create_program(**kwargs):
@@ -636,7 +852,7 @@ def create_program(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Program(raw)
+    return _node(stnode.Program, raw)
 
 
 def create_target(**kwargs):
@@ -665,13 +881,13 @@ def create_target(**kwargs):
         "proposer_ra": _random_angle_degrees(),
         "ra": _random_angle_degrees(),
         "ra_uncertainty": _random_positive_float(),
-        "source_type": _random_choice("EXTENDED", "POINT", "UNKNOWN"),
-        "source_type_apt": _random_choice("EXTENDED", "POINT", "UNKNOWN"),
-        "type": _random_choice("FIXED", "MOVING", "GENERIC"),
+        "source_type": _random_choice(_SOURCE_TYPES),
+        "source_type_apt": _random_choice(_SOURCE_TYPES),
+        "type": _random_choice(_TARGET_TYPES),
     }
     raw.update(kwargs)
 
-    return stnode.Target(raw)
+    return _node(stnode.Target, raw)
 
 
 def create_velocity_aberration(**kwargs):
@@ -696,7 +912,7 @@ def create_velocity_aberration(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.VelocityAberration(raw)
+    return _node(stnode.VelocityAberration, raw)
 
 
 def create_visit(**kwargs):
@@ -714,8 +930,8 @@ def create_visit(**kwargs):
     roman_datamodels.stnode.Visit
     """
     raw = {
-        "engineering_quality": _random_choice("OK", "SUSPECT"),
-        "pointing_engdb_quality": _random_choice("CALCULATED", "PLANNED"),
+        "engineering_quality": _random_choice(_ENGINEERING_QUALITIES),
+        "pointing_engdb_quality": _random_choice(_POINTING_ENGDB_QUALITIES),
         "type": _random_string("Visit type ", 30),
         "start_time": _random_astropy_time(),
         "end_time": _random_astropy_time(),
@@ -725,7 +941,7 @@ def create_visit(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Visit(raw)
+    return _node(stnode.Visit, raw)
 
 
 def create_wcsinfo(**kwargs):
@@ -754,16 +970,34 @@ def create_wcsinfo(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.Wcsinfo(raw)
+    return _node(stnode.Wcsinfo, raw)
+
 
+# Shape of the WfiImage arrays, and the helper and bounds used
+# to generate each of them
+_WFI_IMAGE_SHAPE = (4096, 4096)
+_WFI_IMAGE_ARRAYS = (
+    ("area", _random_array_float32, {}),
+    ("data", _random_array_float32, {}),
+    ("dq", _random_array_uint32, {}),
+    ("err", _random_array_float32, {"min": 0.0}),
+    ("var_flat", _random_array_float32, {}),
+    ("var_poisson", _random_array_float32, {}),
+    ("var_rnoise", _random_array_float32, {}),
+)
 
-def create_wfi_image(**kwargs):
+
+def create_wfi_image(fill_arrays=True, **kwargs):
     """
     Create a dummy WfiImage instance with valid values for attributes
     required by the schema.
 
     Parameters
     ----------
+    fill_arrays : bool, optional
+        If False, leave the arrays uninitialized instead of filling them
+        with random values.  Much faster, for tests that only need the
+        arrays to have the right shape and dtype.
     **kwargs
         Additional or overridden attributes.
 
@@ -771,19 +1005,60 @@ def create_wfi_image(**kwargs):
     -------
     roman_datamodels.stnode.WfiImage
     """
+    # Only generate the arrays that kwargs doesn't override
     raw = {
-        "area": _random_array_float32(),
-        "data": _random_array_float32(),
-        "dq": _random_array_uint32(),
-        "err": _random_array_float32(min=0.0),
-        "meta": create_meta(),
-        "var_flat": _random_array_float32(),
-        "var_poisson": _random_array_float32(),
-        "var_rnoise": _random_array_float32(),
+        key: generate(_WFI_IMAGE_SHAPE, fill=fill_arrays, field=f"WfiImage.{key}", **bounds)
+        for key, generate, bounds in _WFI_IMAGE_ARRAYS
+        if key not in kwargs
     }
+    if "meta" not in kwargs:
+        raw["meta"] = create_meta()
     raw.update(kwargs)
 
-    return stnode.WfiImage(raw)
+    return _node(stnode.WfiImage, raw)
+
+
+def create_wfi_images(n, shape=_WFI_IMAGE_SHAPE, fill_arrays=True, **kwargs):
+    """
+    Create n dummy WfiImage instances with valid values for attributes
+    required by the schema.  Each array attribute is generated for all
+    n models in a single call, and each model holds a view into it
+    (so writing one of them to an ASDF file will write the full block).
+
+    Parameters
+    ----------
+    n : int
+        Number of instances to create.
+    shape : tuple of int, optional
+        Shape of each model's arrays.
+    fill_arrays : bool, optional
+        If False, leave the arrays uninitialized instead of filling them
+        with random values.
+    **kwargs
+        Additional or overridden attributes, applied to every instance.
+
+    Returns
+    -------
+    list of roman_datamodels.stnode.WfiImage
+    """
+    size = (n,) + tuple(shape)
+    # No field is passed, so these blocks never enter the
+    # ROMAN_FACTORY_REUSE_ARRAYS scratch pool (they'd stay in memory)
+    arrays = {
+        key: generate(size, fill=fill_arrays, **bounds)
+        for key, generate, bounds in _WFI_IMAGE_ARRAYS
+        if key not in kwargs
+    }
+
+    images = []
+    for i in range(n):
+        raw = {key: array[i] for key, array in arrays.items()}
+        if "meta" not in kwargs:
+            raw["meta"] = create_meta()
+        raw.update(kwargs)
+        images.append(_node(stnode.WfiImage, raw))
+
+    return images
 
 
 def create_wfi_mode(**kwargs):
@@ -807,16 +1082,20 @@ def create_wfi_mode(**kwargs):
     }
     raw.update(kwargs)
 
-    return stnode.WfiMode(raw)
+    return _node(stnode.WfiMode, raw)
 
 
-def create_wfi_science_raw(**kwargs):
+def create_wfi_science_raw(fill_arrays=True, **kwargs):
     """
     Create a dummy WfiScienceRaw instance with valid values for attributes
     required by the schema.
 
     Parameters
     ----------
+    fill_arrays : bool, optional
+        If False, leave the arrays uninitialized instead of filling them
+        with random values.  Much faster, for tests that only need the
+        arrays to have the right shape and dtype.
     **kwargs
         Additional or overridden attributes.
 
@@ -826,21 +1105,32 @@ def create_wfi_science_raw(**kwargs):
     """
     raw = {
         # TODO: What should this shape be?
-        "data": _random_array_uint16((1, 4096, 4096, 2)),
+        "data": _random_array_uint16((1, 4096, 4096, 2), fill=fill_arrays, field="WfiScienceRaw.data"),
         "meta": create_meta(),
         # TODO: What should this shape be?
-        "refout": _random_array_uint16((1, 4096, 4096, 2)),
+        "refout": _random_array_uint16((1, 4096, 4096, 2), fill=fill_arrays, field="WfiScienceRaw.refout"),
         # TODO: What should this shape be?
-        "zeroframe": _random_array_uint16((1, 4096, 4096)),
+        "zeroframe": _random_array_uint16((1, 4096, 4096), fill=fill_arrays, field="WfiScienceRaw.zeroframe"),
     }
     raw.update(kwargs)
 
-    return stnode.WfiScienceRaw(raw)
+    return _node(stnode.WfiScienceRaw, raw)
+
+
+_CAMEL_CASE_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def _camel_case_to_snake_case(value):
     # Courtesy of https://stackoverflow.com/a/1176023
-    return re.sub(r"(?<!^)(?=[A-Z])", "_", value).lower()
+    return _CAMEL_CASE_RE.sub("_", value).lower()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_factory_method(node_class):
+    method_name = "create_" + _camel_case_to_snake_case(node_class.__name__)
+    if method_name not in _FACTORY_METHODS:
+        raise ValueError(f"Factory method not implemented for class {node_class.__name__}")
+    return _FACTORY_METHODS[method_name]
 
 
 def create_node(node_class, **kwargs):
@@ -859,7 +1149,35 @@ def create_node(node_class, **kwargs):
     -------
     roman_datamodels.stnode.TaggedObjectNode
     """
-    method_name = "create_" + _camel_case_to_snake_case(node_class.__name__)
-    if not method_name in globals():
-        raise ValueError(f"Factory method not implemented for class {node_class.__name__}")
-    return globals()[method_name](**kwargs)
+    return _get_factory_method(node_class)(**kwargs)
+
+
+# Keys of the randomly generated common metadata used by create_meta,
+# and callables building their values
+_META_BUILDERS = (
+    ("aperture", create_aperture),
+    ("cal_step", create_cal_step),
+    ("calibration_software_version", lambda: _random_string("Version ", 120)),
+    ("coordinates", create_coordinates),
+    ("crds_context_used", lambda: "roman_{:04d}.pmap".format(_random_positive_int(9999))),
+    ("crds_software_version", _random_software_version),
+    ("file_date", _random_astropy_time),
+    ("ephemeris", create_ephemeris),
+    ("exposure", create_exposure),
+    ("filename", lambda: _random_string("Filename ", 120)),
+    ("guidestar", create_guidestar),
+    ("instrument", create_wfi_mode),
+    ("model_type", lambda: _random_string("Model type ", 50)),
+    ("observation", create_observation),
+    ("photometry", create_photometry),
+    ("pointing", create_pointing),
+    ("prd_software_version", lambda: _random_string("S&OC PRD ", 120)),
+    ("program", create_program),
+    ("sdf_software_version", _random_software_version),
+    ("target", create_target),
+    ("velocity_aberration", create_velocity_aberration),
+    ("visit", create_visit),
+    ("wcsinfo", create_wcsinfo),
+)
+
+_FACTORY_METHODS = {name: globals()[name] for name in __all__ if name.startswith("create_")}
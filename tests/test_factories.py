@@ -1,7 +1,8 @@
 import asdf
+import numpy as np
 import pytest
 
-from roman_datamodels.testing import create_node
+from roman_datamodels.testing import assert_node_equal, create_node, factories
 from roman_datamodels import stnode
 
 
@@ -43,3 +44,90 @@ def test_no_extra_fields(node_class, manifest):
 
     diff = instance_keys - schema_keys
     assert len(diff) == 0, "Factory instance has extra keys: " + ", ".join(diff)
+
+
+def test_create_wfi_images():
+    images = factories.create_wfi_images(3, shape=(8, 8))
+
+    assert len(images) == 3
+    for image in images:
+        assert isinstance(image, stnode.WfiImage)
+        assert image.data.shape == (8, 8)
+        assert image.dq.dtype == np.uint32
+        with asdf.AsdfFile() as af:
+            af["node"] = image
+            af.validate()
+
+
+@pytest.mark.parametrize("node_class", stnode.NODE_CLASSES)
+def test_raw_mode(node_class):
+    factories.set_raw_mode(True)
+    try:
+        instance = create_node(node_class)
+    finally:
+        factories.set_raw_mode(False)
+
+    assert type(instance) is dict
+    assert set(instance.keys()) == set(create_node(node_class).keys())
+
+
+@pytest.mark.parametrize("node_class", stnode.NODE_CLASSES)
+def test_reseed(node_class):
+    factories.reseed(42)
+    first = create_node(node_class)
+    factories.reseed(42)
+    second = create_node(node_class)
+    factories.reseed()
+
+    assert_node_equal(first, second)
+
+
+def test_reuse_arrays(monkeypatch):
+    monkeypatch.setenv("ROMAN_FACTORY_REUSE_ARRAYS", "1")
+    monkeypatch.setattr(factories, "_SCRATCH", {})
+
+    first = factories._random_array_float32((8, 8), field="X.a")
+    second = factories._random_array_float32((8, 8), field="X.a")
+    other = factories._random_array_float32((8, 8), field="X.b")
+    factories._random_array_float32((8, 8))
+    factories._random_array_float32((8, 8), field="X.c", fill=False)
+
+    # Only calls naming a field to be filled are pooled
+    assert len(factories._SCRATCH) == 2
+
+    # Each call gets its own writable copy of the same values
+    assert first.flags.writeable
+    assert not np.shares_memory(first, second)
+    np.testing.assert_array_equal(first, second)
+    first.fill(0)
+    assert second.any()
+
+    # Different fields never share values
+    assert not np.array_equal(second, other)
+
+
+@pytest.mark.parametrize("factory, shapes", [
+    (factories.create_wfi_image, {
+        "area": ((4096, 4096), np.float32),
+        "data": ((4096, 4096), np.float32),
+        "dq": ((4096, 4096), np.uint32),
+        "err": ((4096, 4096), np.float32),
+        "var_flat": ((4096, 4096), np.float32),
+        "var_poisson": ((4096, 4096), np.float32),
+        "var_rnoise": ((4096, 4096), np.float32),
+    }),
+    (factories.create_wfi_science_raw, {
+        "data": ((1, 4096, 4096, 2), np.uint16),
+        "refout": ((1, 4096, 4096, 2), np.uint16),
+        "zeroframe": ((1, 4096, 4096), np.uint16),
+    }),
+])
+def test_unfilled_arrays(factory, shapes):
+    instance = factory(fill_arrays=False)
+
+    for key, (shape, dtype) in shapes.items():
+        assert instance[key].shape == shape
+        assert instance[key].dtype == dtype
+    with asdf.AsdfFile() as af:
+        af["node"] = instance
+        af.validate()